@@ -1,7 +1,20 @@
-from imdb import Cinemagoer
+from imdb import Cinemagoer, IMDbDataAccessError
+import numpy as np
 import pandas as pd
-import pickle 
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
+import csv
+import json
+import os
+import shelve
+import threading
+import time
+import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Literal
+
+IMDB_DATASETS_URL = 'https://datasets.imdbws.com/'
 
 class MovieTitlesParser:
     """
@@ -9,8 +22,9 @@ class MovieTitlesParser:
 
     Attributes:
         file_path (str): The path to the 'movie_titles.csv' file.
-        data (list): A list to store parsed movie data.
-        imdb_info (list); A list containing information about movies / tv shows from the imdb database
+        ids (numpy.ndarray): The parsed MovieID column.
+        years (numpy.ndarray): The parsed ReleaseYear column, 0 where the year is unknown.
+        titles (pyarrow.ChunkedArray): The parsed Title column.
     """
 
     def __init__(self, file_path: str):
@@ -21,55 +35,102 @@ class MovieTitlesParser:
             file_path (str): The path to the 'movie_titles.csv' file.
         """
         self.file_path = file_path
-        self.data = []
+        self.ids = None
+        self.years = None
+        self.titles = None
         
-    def parse_line(self, line: str):
-        """
-        Parses a single line from the 'movie_titles.csv' file.
-
-        Splits the line into MovieID, ReleaseYear, and Title.
-
-        Args:
-            line (str): A line from the 'movie_titles.csv' file.
-
-        Returns:
-            list: A list containing MovieID, ReleaseYear, and Title.
-        """
-        # Remove leading/trailing whitespace
-        line = line.strip()
-        #split the line into maximum 3 parts
-        parts = line.split(',', 2) #only split first 2 commas
-        #Ensure the list has exactly 3 elements
-        if len(parts) < 3:
-            parts.extend([''] * (3 - len(parts)))
-
-        return parts
-
     def parse_file(self):
         """
-        Parses the entire 'movie_titles.csv' file and stores the data in the 'data' attribute.
+        Parses the entire 'movie_titles.csv' file and stores each column in its own attribute.
+
+        Each line is read as a single field by the multi-threaded pyarrow CSV reader and
+        then split on the first two commas only, since some titles contain unquoted commas.
         """
-        #open file and separate into relative sections
-        with open(self.file_path, 'r', encoding = 'ISO-8859-1') as file:
-            for line in file:
-                MovieID, ReleaseYear, Title = self.parse_line(line)
-                self.data.append({
-                    'MovieID': int(MovieID),
-                    'ReleaseYear': int(ReleaseYear) if ReleaseYear.isdigit() else 0,
-                    'Title': Title
-                })
+        #read every line as one column - the unit separator never occurs in the file
+        lines = pacsv.read_csv(
+            self.file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, encoding='ISO-8859-1', column_names=['Line']),
+            parse_options=pacsv.ParseOptions(delimiter='\x1f', quote_char=False),
+            convert_options=pacsv.ConvertOptions(column_types={'Line': pa.string()}, strings_can_be_null=False)
+        ).column('Line')
+        lines = pc.utf8_trim_whitespace(lines)
+        #split into maximum 3 parts - only split first 2 commas
+        parts = pc.extract_regex(lines, r'^(?P<MovieID>[^,]*),?(?P<ReleaseYear>[^,]*),?(?P<Title>.*)$')
+        movie_ids, release_years, titles = parts.flatten()
+
+        #non numeric years (e.g. NULL) become 0
+        release_years = pc.if_else(pc.match_substring_regex(release_years, r'^[0-9]+$'), release_years, '0')
+        #keep one array per column rather than one record per row
+        self.ids = movie_ids.cast(pa.int32()).to_numpy()
+        self.years = release_years.cast(pa.int16()).to_numpy()
+        self.titles = titles
     
     def get_dataframe(self):
         """
         Converts the parsed data into a pandas DataFrame.
 
+        MovieID is stored as int32, ReleaseYear as int16 and Title as string[pyarrow],
+        which wraps the parsed arrow strings without creating a Python object per title.
+
         Returns:
             pandas.DataFrame: A DataFrame containing the movie data.
         """
-        df = pd.DataFrame(self.data)
+        df = pd.DataFrame({
+            'MovieID': self.ids,
+            'ReleaseYear': self.years,
+            'Title': pd.arrays.ArrowStringArray(self.titles)
+        })
 
         return df
             
+class RateLimiter:
+    """
+    A thread safe token bucket limiting how often IMDb is queried.
+
+    Attributes
+    ----------
+    rate : float
+        Number of tokens added per second, i.e. the sustained number of requests per second.
+    capacity : float
+        Maximum number of tokens that can be saved up, i.e. the largest allowed burst.
+    tokens : float
+        Number of tokens currently available. Negative when callers have reserved future tokens.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Initializes the RateLimiter with a full bucket.
+
+        Parameters
+        ----------
+        rate : float
+            Sustained number of requests per second. Must be positive.
+        capacity : float
+            Largest allowed burst of requests.
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Takes one token from the bucket, sleeping until it becomes available if the bucket is empty.
+        """
+        with self.lock:
+            now = time.monotonic()
+            # Refill for the time passed since the last call, then reserve a token
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        # Sleep outside the lock so other threads can reserve the following tokens
+        time.sleep(wait)
+
 class IMDBDataCollector:
     """
     A class to collect and store IMDb data for a list of movies.
@@ -78,28 +139,170 @@ class IMDBDataCollector:
     ----------
     imdb_info : list
         A list to store collected IMDb data for each movie.
+    imdb_by_key : dict
+        Collected IMDb data keyed by (title, release year, detail level), so each distinct movie is only
+        queried once per detail level.
+        Includes the results already written to the output file by earlier runs.
+    output_path : str
+        Path of the JSON lines file each found movie is appended to as soon as it is fetched.
     ia : Cinemagoer
-        An instance of the Cinemagoer class to interact with IMDb.
+        An instance of the Cinemagoer class to interact with IMDb, one per worker thread.
+    max_workers : int
+        Number of worker threads used to query IMDb concurrently.
+    cache : shelve.Shelf
+        A persistent cache of IMDb lookups keyed by movie title and release year.
+    negative_ttl : float
+        Number of seconds a lookup that found no movie stays cached before it is retried.
+    rate_limiter : RateLimiter
+        Limits the request rate to IMDb across all worker threads.
+    max_retries : int
+        Number of attempts made for an IMDb request before giving up.
 
     Methods
     -------
-    __init__():
-        Initializes the IMDBDataCollector with an empty imdb_info list and a Cinemagoer instance.
-    fetch_movie_data(movie_name, year):
+    __init__(cache_path, negative_ttl, max_workers, requests_per_second, max_retries, output_path):
+        Initializes the IMDBDataCollector with an empty imdb_info list, the lookup cache and the output file.
+    fetch_movie_data(movie_name, year, detail_level):
         Fetches movie data from IMDb for a given movie name and release year.
-    get_imdb(movies_df):
+    get_imdb(movies_df, batch_size, max_num_batches, detail_level):
         Concurrently retrieves IMDb data for movies listed in a DataFrame.
+    close():
+        Writes the lookup cache to disk and closes it and the output file.
+
+    The collector is a context manager that calls close() on exit, even when get_imdb raises.
     """
 
-    def __init__(self):
+    def __init__(self, cache_path: str = 'imdb_cache', negative_ttl: float = 24 * 60 * 60, max_workers: int = 10,
+                 requests_per_second: float = 4, max_retries: int = 5, output_path: str = 'imdb_info.jsonl'):
         """
-        Initializes IMDBDataCollector with an empty imdb_info list and a Cinemagoer instance.
+        Initializes IMDBDataCollector with an empty imdb_info list, the lookup cache and the output file.
+
+        Parameters
+        ----------
+        cache_path : str
+            Path of the shelve file used to cache IMDb lookups between runs.
+        negative_ttl : float
+            Number of seconds a lookup that found no movie stays cached before it is retried.
+        max_workers : int
+            Number of worker threads used to query IMDb concurrently.
+        requests_per_second : float
+            Maximum number of requests per second sent to IMDb by all worker threads together. Must be positive.
+        max_retries : int
+            Number of attempts made for an IMDb request before giving up. Must be at least 1.
+        output_path : str
+            Path of the JSON lines file results are appended to. Movies already in the file at the requested
+            detail level are not fetched again.
         """
+        # Validate before any file is opened
+        if requests_per_second <= 0:
+            raise ValueError(f"requests_per_second must be positive, got {requests_per_second}")
+        if max_retries < 1:
+            raise ValueError(f"max_retries must be at least 1, got {max_retries}")
 
         self.imdb_info = [] # List to store IMDb data for each movie
-        self.ia = Cinemagoer() # Initialize Cinemagoer instance once to reuse across methods
+        self.output_path = output_path
+        self.imdb_by_key = self._load_results(output_path) # IMDb data for each distinct (title, year, detail level)
+        self._out = open(output_path, 'a', encoding='utf-8') # Results are appended as they arrive
+        self._local = threading.local() # Holds one Cinemagoer instance per worker thread
+        self.max_workers = max_workers
+        self.cache = shelve.open(cache_path) # Persistent cache so repeated runs skip already fetched movies
+        self.cache_lock = threading.Lock() # shelve is not thread safe
+        self.negative_ttl = negative_ttl
+        self.rate_limiter = RateLimiter(requests_per_second) # Shared by all worker threads
+        self.max_retries = max_retries
+
+    @staticmethod
+    def _load_results(output_path: str):
+        """
+        Reads the results written by earlier runs from the output file.
+
+        Parameters
+        ----------
+        output_path : str
+            Path of the JSON lines output file.
+
+        Returns
+        -------
+        dict
+            The stored movie data keyed by (title, release year, detail level). Empty if the file does not exist.
+        """
+        results = {}
+        if not os.path.exists(output_path):
+            return results
+
+        with open(output_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    result = json.loads(line)
+                except json.JSONDecodeError:
+                    # Skip a line left incomplete by an interrupted run
+                    continue
+                # Records written before the detail level was stored are full unless they lack the full fields
+                detail_level = result.get('Detail Level', 'full' if 'Genres' in result else 'lite')
+                results[(result['Title'], result['Release Year'], detail_level)] = result
+
+        return results
+
+    @property
+    def ia(self):
+        """
+        Returns the Cinemagoer instance of the calling thread, creating it on first use.
+
+        Cinemagoer keeps HTTP state on the instance and is not safe to share between threads,
+        so each worker gets its own instance which it then reuses for all of its lookups.
+        """
+        if not hasattr(self._local, 'ia'):
+            self._local.ia = Cinemagoer()
+        return self._local.ia
 
-    def fetch_movie_data(self, movie_name: str, year: int):
+    @staticmethod
+    def _normalize_title(title: str):
+        """
+        Normalizes a title for comparison by casefolding it and dropping punctuation and repeated whitespace.
+
+        Parameters
+        ----------
+        title : str
+            The title to normalize.
+
+        Returns
+        -------
+        str
+            The normalized title, e.g. 'Star Wars: Episode IV' becomes 'star wars episode iv'.
+        """
+        return ' '.join(''.join(c for c in title.casefold() if c.isalnum() or c.isspace()).split())
+
+    def _call_imdb(self, method, *args, **kwargs):
+        """
+        Calls a Cinemagoer method within the rate limit, retrying with exponential backoff.
+
+        Parameters
+        ----------
+        method : callable
+            The Cinemagoer method to call, e.g. search_movie.
+        *args, **kwargs
+            Arguments passed on to the method.
+
+        Returns
+        -------
+        object
+            The value returned by the method.
+
+        Notes
+        -----
+        - Only IMDbDataAccessError (network errors and HTTP errors such as 429 or 503) is retried.
+        - Waits 1, 2, 4, ... seconds between attempts, capped at 30 seconds.
+        """
+        for attempt in range(self.max_retries):
+            self.rate_limiter.acquire()
+            try:
+                return method(*args, **kwargs)
+            except IMDbDataAccessError:
+                if attempt == self.max_retries - 1:
+                    raise
+                time.sleep(min(2 ** attempt, 30))
+
+    def fetch_movie_data(self, movie_name: str, year: int, detail_level: Literal['lite', 'full'] = 'full'):
         """
         Fetches movie data from IMDb for a given movie name and release year.
 
@@ -109,6 +312,9 @@ class IMDBDataCollector:
             The title of the movie to search for.
         year : int
             The release year of the movie.
+        detail_level : {'lite', 'full'}
+            'lite' returns only the title, year, IMDb ID and type available from the search results.
+            'full' additionally fetches the movie page for genres, director, rating and cast.
 
         Returns
         -------
@@ -117,82 +323,336 @@ class IMDBDataCollector:
 
         Notes
         -----
-        - Searches for the movie by title and filters results by release year.
-        - Retrieves detailed information for the first matching movie.
+        - Searches for the movie by title and takes the first of the top 5 results with the same
+          release year and the same title, ignoring case and punctuation.
+        - Retrieves detailed information for the first matching movie, unless detail_level is 'lite'.
+        - Results are cached on disk; movies that were not found are retried once negative_ttl has passed.
+          Lookups that raised an error are not cached.
         """
+        key = f"{movie_name}\x1f{year}\x1f{detail_level}"
+        with self.cache_lock:
+            cached = self.cache.get(key)
+        if cached is not None:
+            cached_at, result = cached
+            if result is not None or time.time() - cached_at < self.negative_ttl:
+                return result
+
         try:
-            # Search for movies matching the given title
-            movies = self.ia.search_movie(movie_name)
+            result = None
+            # Search for movies matching the given title - only build the top 5 results, not Cinemagoer's default 20
+            movies = self._call_imdb(self.ia.search_movie, movie_name, results=5)
+            target = self._normalize_title(movie_name)
             for movie in movies:
-                # Check if the release year matches
-                if movie['year'] == year and movie['title'] == movie_name:
+                # Check if the release year matches, ignoring case and punctuation in the title
+                if movie.get('year') == year and self._normalize_title(movie.get('title', '')) == target:
                     movie_id = movie.movieID
-                    movie_details = self.ia.get_movie(movie_id)
+                    if detail_level == 'lite':
+                        # The search result already holds these fields, so skip the movie page request
+                        result = {
+                            'Title': movie_name,
+                            'Release Year': int(year),
+                            'IMDB_ID': movie_id,
+                            'Type': movie.get('kind'),
+                            'Detail Level': detail_level
+                        }
+                        break
+                    movie_details = self._call_imdb(self.ia.get_movie, movie_id)
                     # Build a dictionary with relevant movie data
-                    return {
+                    result = {
                         'Title': movie_name,
-                        'Release Year': year,
+                        'Release Year': int(year),
+                        'IMDB_ID': movie_id,
                         'Type': movie_details.get('kind'),
                         'Genres': movie_details.get('genres', []),
                         'Director': [director.personID for director in movie_details.get('directors', [])],
                         'IMDB Rating': movie_details.get('rating', []),
-                        'Cast': [actor.personID for actor in movie_details.get('cast', [])]
+                        'Cast': [actor.personID for actor in movie_details.get('cast', [])],
+                        'Detail Level': detail_level
                     }
+                    break
+
+            with self.cache_lock:
+                self.cache[key] = (time.time(), result)
+            return result
         except Exception as e:
             # Handle exceptions (e.g., network errors, data parsing issues)
             print(f"Error fetching {movie_name}, ({year}): {e}")
 
         return None # Return None if movie not found or an error occurred
     
-    def get_imdb(self, movies_df: pd.DataFrame, batch_size: int=30, max_num_batches: int = 1e7):
+    def _fetch_keyed(self, movie_name: str, year: int, detail_level: Literal['lite', 'full'] = 'full'):
+        """
+        Fetches movie data like fetch_movie_data and returns it together with its (title, year, detail level) key.
+
+        Returns
+        -------
+        tuple
+            The (movie_name, year, detail_level) key and the movie data dictionary or None.
+        """
+        return (movie_name, year, detail_level), self.fetch_movie_data(movie_name, year, detail_level)
+
+    def get_imdb(self, movies_df: pd.DataFrame, batch_size: int=30, max_num_batches: int = 1e7,
+                 detail_level: Literal['lite', 'full'] = 'full', progress_every: int = 100):
         """
-        Concurrently retrieves IMDb data for movies listed in a DataFrame in batches.
+        Concurrently retrieves IMDb data for movies listed in a DataFrame.
 
         Parameters
         ----------
         movies_df : pandas.DataFrame
             DataFrame containing 'Title' and 'ReleaseYear' columns for movies to search on IMDb.
         batch_size : int
-            Integer containing the size of batches for ThreadPoolExecuter to fetch data.
+            Number of movies per batch, used together with max_num_batches to limit the search.
         max_num_batches: int
-            maximum number of batches to search to run.
+            maximum number of batches to search, i.e. at most max_num_batches * batch_size movies.
+        detail_level : {'lite', 'full'}
+            Passed on to fetch_movie_data. 'lite' halves the number of IMDb requests when genres,
+            director, rating and cast are not needed. Results of the other level in the output file
+            are not reused.
+        progress_every : int
+            Print a progress update every time this many more movies have been found. Must be at least 1.
 
         Notes
         -----
         - Uses ThreadPoolExecutor to fetch data concurrently.
-        - Updates the imdb_info list with data for each found movie.
-        - Prints progress updates showing the number of movies found.
-        """
-        # Use ThreadPoolExecutor to fetch data concurrently - set max workers to 10 so that IMDb is not overloaded
-        batch_start_index = 0
-        batch_counter = 0
-
-        while batch_counter < max_num_batches and batch_start_index < len(movies_df['Title']) - batch_size:
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                # Map each future to its corresponding movie title and year
-                batch_titles = movies_df['Title'].iloc[batch_start_index:batch_start_index + batch_size]
-                batch_years = movies_df['ReleaseYear'].iloc[batch_start_index:batch_start_index + batch_size]
-
-                futures = {executor.submit(self.fetch_movie_data, movie_name, year):
-                           (movie_name, year) for movie_name, year in zip(
-                                batch_titles,
-                                batch_years)}
-                # Process completed futures as they become available
-                for future in as_completed(futures):
-                    movie_name, year = futures[future]  # Retrieve the original movie name and year
-                    try:
-                        result = future.result()  # Get the result of the future
-                        if result:
-                            self.imdb_info.append(result)  # Append the movie data to imdb_info
-                            print(f"Movies Found: {len(self.imdb_info)}/{len(movies_df['Title'])}")  # Progress update
-                    except Exception as e:
-                        # Handle exceptions that occurred during data fetching
-                        print(f"Error processing {movie_name} ({year}): {e}")
-            batch_start_index += batch_size
-            batch_counter += 1
-            if batch_counter > max_num_batches:
-                print(f"Reached max num batches {max_num_batches}, so aborting")
-                break
+        - Each distinct (title, year) pair is only queried once; the limit applies to the distinct pairs.
+        - Pairs already stored in the output file at this detail level are skipped, and each found movie
+          is appended to it immediately.
+        - Updates the imdb_info list with data for each found movie row.
+        - Prints progress updates showing the number of movies found every progress_every movies and at the end.
+        """
+        if progress_every < 1:
+            raise ValueError(f"progress_every must be at least 1, got {progress_every}")
+
+        # Duplicate rows would only repeat the same IMDb queries
+        unique_pairs = movies_df[['Title', 'ReleaseYear']].drop_duplicates()
+        # Skip movies that earlier runs already wrote to the output file
+        # A boolean array rather than a list, since an empty list would select zero columns
+        not_stored = np.array([(title, year, detail_level) not in self.imdb_by_key
+                               for title, year in zip(unique_pairs['Title'], unique_pairs['ReleaseYear'])], dtype=bool)
+        unique_pairs = unique_pairs.loc[not_stored]
+
+        # Only search the first max_num_batches batches, including a final partial batch
+        num_movies = int(min(len(unique_pairs), max_num_batches * batch_size))
+        if num_movies < len(unique_pairs):
+            print(f"Limiting search to {max_num_batches} batches ({num_movies}/{len(unique_pairs)} movies)")
+        titles = unique_pairs['Title'].to_numpy()[:num_movies]
+        years = unique_pairs['ReleaseYear'].to_numpy()[:num_movies]
+        found = 0
+
+        # Use ThreadPoolExecutor to fetch data concurrently - keep max_workers modest so that IMDb is not overloaded
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Each future returns its own (title, year, detail level) key alongside the result
+            futures = [executor.submit(self._fetch_keyed, movie_name, year, detail_level)
+                       for movie_name, year in zip(titles, years)]
+            # Process completed futures as they become available
+            for future in as_completed(futures):
+                try:
+                    key, result = future.result()  # Get the result of the future
+                    if result:
+                        self.imdb_by_key[key] = result  # Store the movie data by its key
+                        self._out.write(json.dumps(result) + '\n')  # Persist it straight away
+                        self._out.flush()
+                        found += 1
+                        if found % progress_every == 0:
+                            print(f"Movies Found: {found}/{num_movies}")  # Progress update
+                except Exception as e:
+                    # Handle exceptions that occurred during data fetching
+                    print(f"Error processing movie: {e}")
+        # Final count, unless the last in-loop update already printed it
+        if found == 0 or found % progress_every != 0:
+            print(f"Movies Found: {found}/{num_movies}")
+
+        # Join the results back to the original rows in one pass
+        row_results = (self.imdb_by_key.get((title, year, detail_level))
+                       for title, year in zip(movies_df['Title'], movies_df['ReleaseYear']))
+        self.imdb_info.extend(result for result in row_results if result)
+
+    def close(self):
+        """
+        Writes the lookup cache to disk and closes it and the output file.
+        """
+        with self.cache_lock:
+            self.cache.close()
+        self._out.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class IMDBDatasetCollector:
+    """
+    A class to collect IMDb data for a list of movies from IMDb's bulk TSV datasets.
+
+    Joins the movies against local copies of title.basics, title.ratings, title.crew and
+    title.principals instead of querying IMDb per movie. The records use the field names of
+    IMDBDataCollector's full records, with these differences:
+
+    - 'Cast' comes from title.principals, which only lists the top-billed principals, not the full cast.
+    - 'IMDB Rating' is None when a title has no rating, rather than [].
+    - There is no 'Detail Level' field.
+
+    Attributes
+    ----------
+    imdb_info : list
+        A list to store collected IMDb data for each movie.
+    data_dir : str
+        Directory the datasets are downloaded to. Files already present are reused.
+
+    Methods
+    -------
+    __init__(data_dir):
+        Initializes the IMDBDatasetCollector with an empty imdb_info list.
+    read_dataset(name, usecols, dtype, chunksize):
+        Downloads an IMDb dataset if needed and reads it into a DataFrame.
+    get_imdb(movies_df):
+        Matches the movies listed in a DataFrame against the IMDb datasets.
+    """
+
+    # Map IMDb dataset title types to the kinds reported by Cinemagoer
+    TITLE_TYPES = {
+        'movie': 'movie',
+        'short': 'short',
+        'tvSeries': 'tv series',
+        'tvMiniSeries': 'tv mini series',
+        'tvMovie': 'tv movie',
+        'tvSpecial': 'tv special',
+        'tvShort': 'tv short',
+        'tvEpisode': 'episode',
+        'video': 'video movie',
+        'videoGame': 'video game'
+    }
+
+    def __init__(self, data_dir: str = 'imdb_datasets'):
+        """
+        Initializes IMDBDatasetCollector with an empty imdb_info list.
+
+        Parameters
+        ----------
+        data_dir : str
+            Directory the datasets are downloaded to.
+        """
+        self.imdb_info = [] # List to store IMDb data for each movie
+        self.data_dir = data_dir
+
+    def read_dataset(self, name: str, usecols: list, dtype: dict = None, chunksize: int = None):
+        """
+        Downloads an IMDb dataset if it is not in data_dir yet and reads it into a DataFrame.
+
+        Parameters
+        ----------
+        name : str
+            File name of the dataset, e.g. 'title.basics.tsv.gz'.
+        usecols : list
+            Columns to read.
+        dtype : dict
+            Column types passed on to pandas.read_csv.
+        chunksize : int
+            If given, returns an iterator of DataFrames with this many rows each.
+
+        Returns
+        -------
+        pandas.DataFrame or iterator of pandas.DataFrame
+            The dataset contents. Missing values ('\\N' in the files) are NA.
+        """
+        path = os.path.join(self.data_dir, name)
+        if not os.path.exists(path):
+            os.makedirs(self.data_dir, exist_ok=True)
+            print(f"Downloading {name}")
+            # Download to a temporary name so an interrupted download is never mistaken for a complete file
+            urllib.request.urlretrieve(IMDB_DATASETS_URL + name, path + '.part')
+            os.replace(path + '.part', path)
+
+        # Titles contain stray quote characters, so quoting has to be disabled
+        return pd.read_csv(path, sep='\t', compression='gzip', usecols=usecols, dtype=dtype,
+                           na_values='\\N', keep_default_na=False, quoting=csv.QUOTE_NONE,
+                           chunksize=chunksize)
+
+    def get_imdb(self, movies_df: pd.DataFrame):
+        """
+        Matches the movies listed in a DataFrame against the IMDb datasets.
+
+        Parameters
+        ----------
+        movies_df : pandas.DataFrame
+            DataFrame containing 'Title' and 'ReleaseYear' columns for movies to look up.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per matched movie row, with the fields described in the class docstring.
+
+        Notes
+        -----
+        - Titles are compared case insensitively against the primary title and start year.
+        - When several IMDb titles match, the one with the most votes is used.
+        - Updates the imdb_info list with data for each found movie row.
+        """
+        movies = movies_df[['Title', 'ReleaseYear']].drop_duplicates()
+        movies = movies.assign(MatchTitle=movies['Title'].astype(str).str.strip().str.casefold(),
+                               startYear=movies['ReleaseYear'].astype('Int16'))
+        years = set(movies['startYear'])
+        match_titles = set(movies['MatchTitle'])
+
+        def candidate_titles(chunk):
+            # Cheap year filter first, so only the remaining rows are casefolded and compared by title
+            chunk = chunk[chunk['startYear'].isin(years)]
+            chunk = chunk.assign(MatchTitle=chunk['primaryTitle'].str.strip().str.casefold())
+            return chunk[chunk['MatchTitle'].isin(match_titles)]
+
+        # title.basics has over 10M rows, so it is read in chunks and only candidate titles are kept
+        basics = pd.concat(
+            candidate_titles(chunk)
+            for chunk in self.read_dataset('title.basics.tsv.gz',
+                                           ['tconst', 'titleType', 'primaryTitle', 'startYear', 'genres'],
+                                           dtype={'startYear': 'Int16'}, chunksize=1_000_000)
+        )
+        ratings = self.read_dataset('title.ratings.tsv.gz', ['tconst', 'averageRating', 'numVotes'])
+        basics = basics.merge(ratings, on='tconst', how='left')
+        # Keep the most voted title for each (title, year) so every movie matches at most once
+        basics = (basics.sort_values('numVotes', ascending=False)
+                  .drop_duplicates(['MatchTitle', 'startYear']))
+
+        matched = movies.merge(basics, on=['MatchTitle', 'startYear'], how='inner')
+        tconsts = set(matched['tconst'])
+
+        # title.crew has over 10M rows too, so it is also read in chunks keeping only the rows of matched titles
+        crew = pd.concat(
+            chunk[chunk['tconst'].isin(tconsts)]
+            for chunk in self.read_dataset('title.crew.tsv.gz', ['tconst', 'directors'], chunksize=1_000_000)
+        )
+        # title.principals is several GB uncompressed, so only keep the rows of matched titles
+        principals = pd.concat(
+            chunk[chunk['tconst'].isin(tconsts) & chunk['category'].isin(['actor', 'actress'])]
+            for chunk in self.read_dataset('title.principals.tsv.gz', ['tconst', 'nconst', 'category'],
+                                           chunksize=1_000_000)
+        )
+        cast = principals.groupby('tconst', sort=False)['nconst'].agg(list).rename('cast')
+        matched = matched.merge(crew, on='tconst', how='left').merge(cast, on='tconst', how='left')
+
+        def split_ids(ids):
+            # IMDb datasets prefix IDs with 'nm' / 'tt', Cinemagoer does not
+            return [i[2:] for i in ids.split(',')] if isinstance(ids, str) else []
+
+        results = pd.DataFrame({
+            'Title': matched['Title'],
+            'Release Year': matched['ReleaseYear'].astype(int),
+            'IMDB_ID': matched['tconst'].str[2:],
+            'Type': matched['titleType'].map(self.TITLE_TYPES),
+            'Genres': [g.split(',') if isinstance(g, str) else [] for g in matched['genres']],
+            'Director': [split_ids(d) for d in matched['directors']],
+            'IMDB Rating': matched['averageRating'].astype(object).where(matched['averageRating'].notna(), None),
+            'Cast': [[c[2:] for c in ids] if isinstance(ids, list) else [] for ids in matched['cast']]
+        })
+
+        # Join the results back to the original rows
+        results = movies_df[['Title', 'ReleaseYear']].merge(results, left_on=['Title', 'ReleaseYear'],
+                                                            right_on=['Title', 'Release Year'], how='inner')
+        results = results.drop(columns='ReleaseYear')
+        self.imdb_info.extend(results.to_dict('records'))
+
+        return results
 
 
 if __name__ == "__main__":
@@ -205,12 +665,12 @@ if __name__ == "__main__":
 
     #movie_titles.head()
 
-    collector = IMDBDataCollector()
-    collector.get_imdb(movie_titles, max_num_batches = 10)
+    # The bulk datasets cover every title at once, IMDBDataCollector is only needed for live lookups
+    collector = IMDBDatasetCollector()
+    imdb_info = collector.get_imdb(movie_titles)
     #print(collector.imdb_info)
-    # Save results
-    with open('imdb_info.pkl', 'wb') as f:
-        pickle.dump(collector.imdb_info, f)
+    # Save results - separate from imdb_info.jsonl, which IMDBDataCollector appends to and resumes from
+    imdb_info.to_json('imdb_dataset_info.jsonl', orient='records', lines=True)
 
 
 